@@ -1,5 +1,12 @@
 from MEBaseConan import MEBaseConan
-from conans import CMake
+
+_CMAKE_OPTION_DEFINITIONS = {
+    "THREADSCHEDULE_RUNTIME": "shared_runtime",
+    "THREADSCHEDULE_MODULE": "cpp_module",
+    "THREADSCHEDULE_BUILD_EXAMPLES": "build_examples",
+    "THREADSCHEDULE_BUILD_TESTS": "build_tests",
+    "THREADSCHEDULE_BUILD_BENCHMARKS": "build_benchmarks",
+}
 
 
 class ThreadScheduleConan(MEBaseConan):
@@ -29,15 +36,31 @@ class ThreadScheduleConan(MEBaseConan):
 
     def _configure_cmake(self):
         cmake = super()._configure_cmake()
-        cmake.definitions["THREADSCHEDULE_RUNTIME"] = "ON" if self.options.shared_runtime else "OFF"
-        cmake.definitions["THREADSCHEDULE_MODULE"] = "ON" if self.options.cpp_module else "OFF"
-        cmake.definitions["THREADSCHEDULE_BUILD_EXAMPLES"] = "ON" if self.options.build_examples else "OFF"
-        cmake.definitions["THREADSCHEDULE_BUILD_TESTS"] = "ON" if self.options.build_tests else "OFF"
-        cmake.definitions["THREADSCHEDULE_BUILD_BENCHMARKS"] = "ON" if self.options.build_benchmarks else "OFF"
+        for definition, option in _CMAKE_OPTION_DEFINITIONS.items():
+            cmake.definitions[definition] = "ON" if getattr(self.options, option) else "OFF"
         cmake.definitions["THREADSCHEDULE_INSTALL"] = "ON" 
         cmake.definitions["THREADSCHEDULE_BUILD_DOCS"] = "OFF"
         return cmake
 
+    def package_id(self):
+        super().package_id()
+
+        # Examples, tests and benchmarks are never installed, so they must not split the binary
+        del self.info.options.build_examples
+        del self.info.options.build_tests
+        del self.info.options.build_benchmarks
+
+        # Without the runtime DLL or the module archive nothing is compiled into the package.
+        # os (pthread/rt link line), compiler.cppstd (cxx_std_* compile feature) and arch
+        # (ConfigVersion pointer-size check, lib vs lib64 config dir) still shape what is
+        # installed, so only build_type and the MSVC runtime that follows it are dropped.
+        if not self.options.shared_runtime and not self.options.cpp_module:
+            del self.info.settings.build_type
+            if self.settings.get_safe("compiler.runtime") is not None:
+                del self.info.settings.compiler.runtime
+            if self.settings.get_safe("compiler.runtime_type") is not None:
+                del self.info.settings.compiler.runtime_type
+
     def package_info(self):
         super().package_info() 
         